@@ -1,18 +1,29 @@
+import io
 import os
 import re
-import json
+import sys
 import time
+import json
+import functools
+import threading
+from collections import deque
 import webbrowser
+from html import unescape
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
 from urllib.parse import urljoin, urlparse, urlencode, parse_qsl, urlunparse
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 import urllib3
+from urllib3.util.retry import Retry
 import warnings
+from concurrent.futures import ThreadPoolExecutor, wait as futures_wait
 
-from PySide6.QtCore import QObject, QThread, Signal, Qt, Slot
+from PySide6.QtCore import QObject, QThread, QTimer, Signal, Qt, Slot
+from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QLabel, QLineEdit, QPushButton, QFileDialog, QMessageBox, QTextEdit,
@@ -20,12 +31,30 @@ from PySide6.QtWidgets import (
     QButtonGroup, QSizePolicy, QSpacerItem
 )
 
+try:  # optional: schnelleres JSON-Parsing/-Schreiben
+    import orjson
+except ImportError:
+    orjson = None
+
 # ------------------------------------------------------------
 # Config
 # ------------------------------------------------------------
 BASE = "https://www.portafontium.eu"
 UA = {"User-Agent": "pf-pyside6-multitab-crawler/4.5 (personal use)"}
 
+CONCURRENCY = 8  # parallele Requests (Ergebnisseiten / Periodika)
+FORM_TIMEOUT = 10  # Sekunden je Formular-Request (beim Start/Sprachwechsel)
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps_bytes(obj) -> bytes:
+    """JSON (indent=2, UTF-8) als ein einziger bytes-Block – ein write() statt vieler kleiner."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 PF_VERIFY = False  # bei dir: PortaFontium TLS problematisch
 if PF_VERIFY is False:
     urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -36,13 +65,32 @@ def make_session() -> requests.Session:
     s = requests.Session()
     s.headers.update(UA)
     s.verify = PF_VERIFY
+    # Keep-Alive-Pool: Pool groß genug für alle parallelen Worker (CONCURRENCY)
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
     return s
 
 
-def fetch_html(session: requests.Session, url: str, timeout=30) -> str:
+# eine gemeinsame Session für alle Requests (Formulare, Crawl, Periodika),
+# damit TCP/TLS-Verbindungen wiederverwendet werden
+_SESSION = make_session()
+
+
+def fetch_bytes(session: requests.Session, url: str, timeout=30) -> bytes:
+    """Roher Body ohne Decoding – für Regex-Scans, die keinen str brauchen."""
     r = session.get(url, timeout=timeout, allow_redirects=True)
     r.raise_for_status()
-    return r.text
+    return r.content
+
+
+def fetch_html(session: requests.Session, url: str, timeout=30) -> str:
+    # PortaFontium liefert immer UTF-8 -> einmal direkt dekodieren statt r.text (Encoding-Erkennung)
+    return fetch_bytes(session, url, timeout=timeout).decode("utf-8", errors="replace")
 
 
 # ------------------------------------------------------------
@@ -66,6 +114,7 @@ STR = {
         "home": "Zur Webseite – {tab}",
         "crawler_opts": "Crawler",
         "delay": "Delay (s):",
+        "delay_tip": "Mindestabstand zwischen zwei Seitenabrufen (bis zu {n} laufen parallel).",
         "max_pages": "Max Seiten:",
         "tab_register": "Matriken",
         "tab_chronicle": "Chroniken",
@@ -94,6 +143,7 @@ STR = {
         "home": "Na web – {tab}",
         "crawler_opts": "Crawler",
         "delay": "Delay (s):",
+        "delay_tip": "Minimální odstup mezi dvěma požadavky na stránky (až {n} běží souběžně).",
         "max_pages": "Max stránek:",
         "tab_register": "Matriky",
         "tab_chronicle": "Kroniky",
@@ -108,6 +158,8 @@ STR = {
 }
 
 
+# STR ist statisch -> Ergebnisse (inkl. format()) je (lang, key, kwargs) cachen
+@functools.lru_cache(maxsize=1024)
 def tr(lang: str, key: str, **kw) -> str:
     s = STR.get(lang, STR["de"]).get(key, key)
     return s.format(**kw) if kw else s
@@ -137,30 +189,52 @@ TABS: List[TabDef] = [
     TabDef("amtsbuch",   "/searching/amtsbuch",   ("/amtsbuch/", "/iipimage/")),
 ]
 
+# Keys sind eindeutig; Lookup per Key statt linearer Suche über TABS
+TABS_BY_KEY: Dict[str, TabDef] = {t.key: t for t in TABS}
+assert len(TABS_BY_KEY) == len(TABS), "TabDef.key muss eindeutig sein"
+
 
 # ------------------------------------------------------------
 # URL helpers
 # ------------------------------------------------------------
+_LANG_PARAM_RE = re.compile(r"(?<=[?&])language(?:=[^&]*)?(?:&|$)", re.I)
+
+
+# pure Funktion; dieselben URLs laufen über Seiten und Periodika-Expansion mehrfach durch.
+# Ergebnis wird interniert: kanonische URLs liegen nur einmal im Speicher, egal in wie vielen
+# Sets/Dicts/Listen sie stecken (Crawl -> Dedup -> JSON).
+@functools.lru_cache(maxsize=65536)
 def strip_language_param(url: str) -> str:
     if not url:
         return url
+    if "#" not in url:
+        # Fast-Path: PF-URLs haben eine kleine, wohlgeformte Query -> direkt per Regex
+        return sys.intern(_LANG_PARAM_RE.sub("", url).rstrip("?&"))
     p = urlparse(url)
     if not p.query:
-        return urlunparse((p.scheme, p.netloc, p.path, p.params, "", ""))
+        return sys.intern(urlunparse((p.scheme, p.netloc, p.path, p.params, "", "")))
     qs = [(k, v) for (k, v) in parse_qsl(p.query, keep_blank_values=True) if k.lower() != "language"]
     new_query = urlencode(qs, doseq=True)
-    return urlunparse((p.scheme, p.netloc, p.path, p.params, new_query, ""))
+    return sys.intern(urlunparse((p.scheme, p.netloc, p.path, p.params, new_query, "")))
 
 
 # ------------------------------------------------------------
 # Drupal View Info parsing
 # ------------------------------------------------------------
+_VIEW_ID_RE = re.compile(r"\bview-id-([a-zA-Z0-9_]+)\b")
+_VIEW_DISP_RE = re.compile(r"\bview-display-id-([a-zA-Z0-9_]+)\b")
+_VIEW_DOM_RE = re.compile(r"\bview-dom-id-([a-f0-9]{32})\b")
+_VIEW_FORM_RE = re.compile(r'id="views-exposed-form-([a-zA-Z0-9_]+)-([a-zA-Z0-9_\-]+)"')
+_THEME_RE = re.compile(r'"theme"\s*:\s*"([^"]+)"')
+_THEME_TOKEN_RE = re.compile(r'"theme_token"\s*:\s*"([^"]+)"')
+
+
 def parse_drupal_view_info(html: str) -> dict:
     info = {}
 
-    m_name = re.search(r"\bview-id-([a-zA-Z0-9_]+)\b", html)
-    m_disp = re.search(r"\bview-display-id-([a-zA-Z0-9_]+)\b", html)
-    m_dom = re.search(r"\bview-dom-id-([a-f0-9]{32})\b", html)
+    m_name = _VIEW_ID_RE.search(html)
+    m_disp = _VIEW_DISP_RE.search(html)
+    m_dom = _VIEW_DOM_RE.search(html)
     if m_name:
         info["view_name"] = m_name.group(1)
     if m_disp:
@@ -168,13 +242,13 @@ def parse_drupal_view_info(html: str) -> dict:
     if m_dom:
         info["view_dom_id"] = m_dom.group(1)
 
-    m_form = re.search(r'id="views-exposed-form-([a-zA-Z0-9_]+)-([a-zA-Z0-9_\-]+)"', html)
+    m_form = _VIEW_FORM_RE.search(html)
     if m_form:
         info.setdefault("view_name", m_form.group(1))
         info.setdefault("view_display_id", m_form.group(2).replace("-", "_"))
 
-    m_theme = re.search(r'"theme"\s*:\s*"([^"]+)"', html)
-    m_token = re.search(r'"theme_token"\s*:\s*"([^"]+)"', html)
+    m_theme = _THEME_RE.search(html)
+    m_token = _THEME_TOKEN_RE.search(html)
     if m_theme:
         info["theme"] = m_theme.group(1)
     if m_token:
@@ -197,7 +271,7 @@ class WidgetSpec:
 
 
 def _clean_label(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip()
+    return " ".join((s or "").split())
 
 def pick_default_option(opts: List[Tuple[str, str]]) -> str:
     if not opts:
@@ -275,17 +349,34 @@ PF_OPTION_DE = {
 }
 
 
+# ein Lookup mit case-gefalteten Keys (PF_TEXT_DE hat Vorrang vor PF_OPTION_DE)
+_PF_MERGED = {k.casefold(): v for k, v in {**PF_OPTION_DE, **PF_TEXT_DE}.items()}
+
+
 def _pf_translate_de(text: str) -> str:
     """Übersetzt bekannte PF-Texte (CZ/DE gemischt) in sinnvolle DE-Begriffe."""
     t = _clean_label(text or "")
     if not t:
         return t
-    # zuerst harte Treffer
-    if t in PF_TEXT_DE:
-        return PF_TEXT_DE[t]
-    if t in PF_OPTION_DE:
-        return PF_OPTION_DE[t]
-    return t
+    return _PF_MERGED.get(t.casefold(), t)
+
+
+_UMKREIS_KW = ("okoli", "okolí", "vicinity", "radius", "distance", "umkreis")
+
+# Feldname enthält Schlüsselwort -> DE-Label (Reihenfolge = Priorität)
+_NAME_LABEL_RULES_DE: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (("archiv", "archive"), "Archiv"),
+    (("title", "titel", "nadpis"), "Titel"),
+    (("misto", "místo", "place", "ort", "lokal", "location"), "Ort"),
+    (("text", "fulltext", "query", "q"), "Text"),
+    (("od_roku", "from", "seit", "von", "_from"), "Von Jahr"),
+    (("do_roku", "to", "bis", "_to"), "Bis Jahr"),
+    (("typ", "type"), "Typ"),
+    (("jazyk", "language", "sprache"), "Sprache"),
+    (("signatur", "signature"), "Signatur"),
+    (("verlagsort", "publisher", "place_of_pub"), "Erscheinungsort"),
+    (("kronik", "chronicle"), "Chroniken"),
+)
 
 
 def _pf_label_from_name_de(name: str, current_label: str) -> str:
@@ -296,34 +387,14 @@ def _pf_label_from_name_de(name: str, current_label: str) -> str:
     n = (name or "").lower()
     cur = _clean_label(current_label or "")
     # Umkreis-Felder immer erzwingen (PF nutzt meist okoli/okolí)
-    if any(k in n for k in ["okoli", "okolí", "vicinity", "radius", "distance", "umkreis"]):
+    if any(k in n for k in _UMKREIS_KW):
         return "Umkreis"
 
-
     # wenn Label fehlt oder 1:1 der Feldname ist -> heuristik
     if (not cur) or (cur.lower() == n):
-        if any(k in n for k in ["archiv", "archive"]):
-            return "Archiv"
-        if any(k in n for k in ["title", "titel", "nadpis"]):
-            return "Titel"
-        if any(k in n for k in ["misto", "místo", "place", "ort", "lokal", "location"]):
-            return "Ort"
-        if any(k in n for k in ["text", "fulltext", "query", "q"]):
-            return "Text"
-        if any(k in n for k in ["od_roku", "from", "seit", "von", "_from"]):
-            return "Von Jahr"
-        if any(k in n for k in ["do_roku", "to", "bis", "_to"]):
-            return "Bis Jahr"
-        if any(k in n for k in ["typ", "type"]):
-            return "Typ"
-        if any(k in n for k in ["jazyk", "language", "sprache"]):
-            return "Sprache"
-        if any(k in n for k in ["signatur", "signature"]):
-            return "Signatur"
-        if any(k in n for k in ["verlagsort", "publisher", "place_of_pub"]):
-            return "Erscheinungsort"
-        if any(k in n for k in ["kronik", "chronicle"]):
-            return "Chroniken"
+        for keywords, label in _NAME_LABEL_RULES_DE:
+            if any(k in n for k in keywords):
+                return label
 
     return cur or name
 
@@ -341,10 +412,8 @@ def localize_widget_for_lang(lang: str, ws: "WidgetSpec") -> "WidgetSpec":
     if ws.options:
         new_opts = []
         for lab, val in ws.options:
-            lab2 = _pf_translate_de(lab)
-            # falls PF_OPTION_DE nicht greift, wenigstens CZ Feldlabels abfangen
-            lab2 = PF_OPTION_DE.get(_clean_label(lab), lab2)
-            new_opts.append((lab2, val))
+            # _pf_translate_de deckt PF_OPTION_DE und PF_TEXT_DE mit einem Lookup ab
+            new_opts.append((_pf_translate_de(lab), val))
         ws.options = new_opts
 
     return ws
@@ -389,10 +458,11 @@ def _element_label(form, elem) -> str:
 
 
 def _is_ignored_input(inp) -> bool:
-    t = (inp.get("type") or "").lower()
+    attrs = inp.attrs
+    t = (attrs.get("type") or "").lower()
     if t in {"submit", "button", "image", "hidden", "reset"}:
         return True
-    if inp.has_attr("disabled"):
+    if "disabled" in attrs:
         return True
     return False
 
@@ -401,16 +471,20 @@ def _is_ignored_control(tag) -> bool:
     if tag.name == "input":
         return _is_ignored_input(tag)
     if tag.name in {"select", "textarea"}:
-        return tag.has_attr("disabled")
+        return "disabled" in tag.attrs
     return True
 
 
-def load_form_spec(session: requests.Session, tab: TabDef, lang: str) -> dict:
+# nur das Views-Formular parsen – der Rest der Seite wird nie gebraucht
+_FORM_STRAINER = SoupStrainer("form", id=re.compile(r"^views-exposed-form-"))
+
+
+def load_form_spec(session: requests.Session, tab: TabDef, lang: str, timeout=30) -> dict:
     url = f"{BASE}{tab.path}?language={lang}"
-    html = fetch_html(session, url)
-    soup = BeautifulSoup(html, "html.parser")
+    html = fetch_html(session, url, timeout=timeout)
+    soup = BeautifulSoup(html, "lxml", parse_only=_FORM_STRAINER)
 
-    form = soup.find("form", id=re.compile(r"^views-exposed-form-"))
+    form = soup.find("form")
     if not form:
         raise RuntimeError("Kein Views-Formular gefunden.")
 
@@ -439,10 +513,11 @@ def load_form_spec(session: requests.Session, tab: TabDef, lang: str) -> dict:
         opts = []
         default = None
         for inp in inputs:
-            val = inp.get("value") or ""
+            attrs = inp.attrs
+            val = attrs.get("value") or ""
             lab = _element_label(form, inp) or val
             opts.append((_clean_label(lab), val))
-            if inp.has_attr("checked"):
+            if "checked" in attrs:
                 default = val
         if default is None:
             default = pick_default_option(opts)
@@ -456,25 +531,27 @@ def load_form_spec(session: requests.Session, tab: TabDef, lang: str) -> dict:
         opts = []
         defaults = []
         for inp in inputs:
-            val = inp.get("value") or "1"
+            attrs = inp.attrs
+            val = attrs.get("value") or "1"
             lab = _element_label(form, inp) or name
             opts.append((_clean_label(lab), val))
-            if inp.has_attr("checked"):
+            if "checked" in attrs:
                 defaults.append(val)
         widgets.append(WidgetSpec(kind="checkbox", name=name, label=group_label or name, options=opts, defaults_multi=defaults))
         seen_names.add(name)
 
     def add_select(sel, label: str):
-        name = sel.get("name") or ""
+        name = sel.attrs.get("name") or ""
         if not name or name in seen_names:
             return
         opts = []
         default = None
-        for opt in sel.select("option"):
+        for opt in sel.find_all("option"):
+            attrs = opt.attrs
             lab = _clean_label(opt.get_text(" ", strip=True))
-            val = opt.get("value") or ""
+            val = attrs.get("value") or ""
             opts.append((lab, val))
-            if opt.has_attr("selected"):
+            if "selected" in attrs:
                 default = val
         if default is None:
             default = pick_default_option(opts)
@@ -483,13 +560,37 @@ def load_form_spec(session: requests.Session, tab: TabDef, lang: str) -> dict:
         seen_names.add(name)
 
     def add_text(inp, label: str):
-        name = inp.get("name") or ""
+        attrs = inp.attrs
+        name = attrs.get("name") or ""
         if not name or name in seen_names:
             return
-        default = inp.get("value") or ""
+        default = attrs.get("value") or ""
         widgets.append(WidgetSpec(kind="text", name=name, label=label or name, options=[], default=default))
         seen_names.add(name)
 
+    # Alle benannten Controls in EINEM Durchlauf einsammeln und über ihre Vorfahren
+    # den Wrappern zuordnen (ein Control kann in mehreren Wrappern liegen).
+    controls = [t for t in form.find_all(["input", "select", "textarea"]) if t.has_attr("name")]
+    controls_by_wrapper: Dict[int, List] = {id(w): [] for w in wrappers}
+    radio_groups: Dict[str, List] = {}
+    check_groups: Dict[str, List] = {}
+    for tag in controls:
+        p = tag.parent
+        while p is not None:
+            lst = controls_by_wrapper.get(id(p))
+            if lst is not None:
+                lst.append(tag)
+            if p is form:
+                break
+            p = p.parent
+        if tag.name == "input":
+            attrs = tag.attrs
+            t = (attrs.get("type") or "").lower()
+            if t == "radio":
+                radio_groups.setdefault(attrs.get("name") or "", []).append(tag)
+            elif t == "checkbox":
+                check_groups.setdefault(attrs.get("name") or "", []).append(tag)
+
     # 1) Wrapper-basiert (bevorzugt)
     for w in wrappers:
         # submit block skippen
@@ -497,68 +598,64 @@ def load_form_spec(session: requests.Session, tab: TabDef, lang: str) -> dict:
             continue
 
         wlabel = _wrapper_label(form, w)
+        w_controls = [t for t in controls_by_wrapper[id(w)] if not _is_ignored_control(t)]
 
         # Wenn ein Wrapper mehrere unterschiedliche Controls enthält,
         # darf wlabel NICHT für alle genommen werden (sonst wird z.B. Umkreis = Ort).
-        names_in_wrapper = []
-        for t in w.select("input[name], select[name], textarea[name]"):
-            if _is_ignored_control(t):
-                continue
-            nm = t.get("name") or ""
-            if nm:
-                names_in_wrapper.append(nm)
-        wrapper_has_multiple = len(set(names_in_wrapper)) > 1
-
+        names_in_wrapper = {t.attrs.get("name") for t in w_controls} - {None, ""}
+        wrapper_has_multiple = len(names_in_wrapper) > 1
 
         # gruppiere radios/checkboxes nach name
         radios_by_name: Dict[str, List] = {}
         checks_by_name: Dict[str, List] = {}
+        selects = []
+        textareas = []
 
-        for inp in w.select("input[name]"):
-            if _is_ignored_input(inp):
+        for tag in w_controls:
+            if tag.name == "select":
+                selects.append(tag)
+                continue
+            if tag.name == "textarea":
+                textareas.append(tag)
                 continue
-            t = (inp.get("type") or "").lower()
+            attrs = tag.attrs
+            t = (attrs.get("type") or "").lower()
 
             if t == "radio":
-                radios_by_name.setdefault(inp.get("name") or "", []).append(inp)
+                radios_by_name.setdefault(attrs.get("name") or "", []).append(tag)
             elif t == "checkbox":
-                checks_by_name.setdefault(inp.get("name") or "", []).append(inp)
+                checks_by_name.setdefault(attrs.get("name") or "", []).append(tag)
             elif t in _INPUT_TEXT_TYPES:
                 # Textfeld
-                lbl = _element_label(form, inp)
+                lbl = _element_label(form, tag)
                 if not lbl and not wrapper_has_multiple:
                     lbl = wlabel
-                add_text(inp, lbl)
-
+                add_text(tag, lbl)
 
         for name, inputs in radios_by_name.items():
             add_radio_group(name, wlabel, inputs)
         for name, inputs in checks_by_name.items():
             add_checkbox_group(name, wlabel, inputs)
 
-        for sel in w.select("select[name]"):
-            if _is_ignored_control(sel):
-                continue
+        for sel in selects:
             lbl = _element_label(form, sel)
             if not lbl and not wrapper_has_multiple:
                 lbl = wlabel
             add_select(sel, lbl)
 
-        for ta in w.select("textarea[name]"):
-            if _is_ignored_control(ta):
-                continue
+        for ta in textareas:
             # Textarea als "text" behandeln
             lbl = _element_label(form, ta)
             if not lbl and not wrapper_has_multiple:
                 lbl = wlabel
             add_text(ta, lbl)
 
-
     # 2) Finale Ergänzung: alle remaining named controls (falls Karten-Feld komplett außerhalb der Wrapper liegt)
-    for tag in form.select("input[name], select[name], textarea[name]"):
+    for tag in controls:
         if _is_ignored_control(tag):
             continue
-        name = tag.get("name") or ""
+        attrs = tag.attrs
+        name = attrs.get("name") or ""
         if not name or name in seen_names:
             continue
 
@@ -567,14 +664,12 @@ def load_form_spec(session: requests.Session, tab: TabDef, lang: str) -> dict:
         elif tag.name == "textarea":
             add_text(tag, _element_label(form, tag))
         elif tag.name == "input":
-            t = (tag.get("type") or "").lower()
+            t = (attrs.get("type") or "").lower()
             if t == "radio":
-                # komplette radio-gruppe suchen
-                grp = form.select(f'input[type="radio"][name="{name}"]')
-                add_radio_group(name, _element_label(form, tag), grp)
+                # komplette radio-gruppe
+                add_radio_group(name, _element_label(form, tag), radio_groups.get(name, []))
             elif t == "checkbox":
-                grp = form.select(f'input[type="checkbox"][name="{name}"]')
-                add_checkbox_group(name, _element_label(form, tag), grp)
+                add_checkbox_group(name, _element_label(form, tag), check_groups.get(name, []))
             elif t in _INPUT_TEXT_TYPES:
                 add_text(tag, _element_label(form, tag))
 
@@ -590,80 +685,149 @@ def load_form_spec(session: requests.Session, tab: TabDef, lang: str) -> dict:
 # ------------------------------------------------------------
 # Link extraction
 # ------------------------------------------------------------
-def extract_iipimage_ids_anywhere(text: str) -> List[str]:
-    ids = re.findall(r"/iipimage/(\d+)", text or "")
-    seen = set()
-    out = []
-    for x in ids:
-        if x not in seen:
-            seen.add(x)
-            out.append(x)
-    return out
+_IIPID_RE = re.compile(r"/iipimage/(\d+)")
+_IIPID_RE_B = re.compile(rb"/iipimage/(\d+)")
+_IIP_PATH_RE = re.compile(r"^/iipimage/(\d+)")
+
+
+def extract_iipimage_ids_anywhere(text: Union[str, bytes]) -> List[str]:
+    if not text:
+        return []
+    if isinstance(text, bytes):
+        # direkt auf dem Response-Body, ohne die ganze Seite zu dekodieren
+        return [x.decode("ascii") for x in dict.fromkeys(_IIPID_RE_B.findall(text))]
+    return list(dict.fromkeys(_IIPID_RE.findall(text)))
 
 
 def normalize_pf_link(tab: TabDef, href: str) -> Optional[str]:
     if not href:
         return None
+    return _normalize_pf_link_cached(tab.allowed_prefixes, tab.prefer_iipimage_root, href)
+
+
+# gleiche hrefs tauchen seitenübergreifend immer wieder auf (Navigation, Paginierung);
+# Schlüssel nur aus primitiven Werten, damit der Cache hashbar und schnell bleibt
+@functools.lru_cache(maxsize=8192)
+def _normalize_pf_link_cached(allowed_prefixes: Tuple[str, ...], prefer_iipimage_root: bool, href: str) -> Optional[str]:
     full = urljoin(BASE, href)
     p = urlparse(full)
     if not p.netloc.endswith("portafontium.eu"):
         return None
 
     path = p.path or ""
-    if not any(path.startswith(pref) for pref in tab.allowed_prefixes):
+    if not path.startswith(allowed_prefixes):
         return None
 
-    if tab.prefer_iipimage_root and path.startswith("/iipimage/"):
-        m = re.match(r"^/iipimage/(\d+)", path)
+    if prefer_iipimage_root and path.startswith("/iipimage/"):
+        m = _IIP_PATH_RE.match(path)
         if m:
             return f"{BASE}/iipimage/{m.group(1)}"
 
     return strip_language_param(p._replace(fragment="").geturl())
 
 
+# Fast-Path: <a href> per Regex aus der Ergebnistabelle (table.views-table)
+_VIEWS_TABLE_RE = re.compile(r"""<table\b[^>]*\bclass\s*=\s*["'][^"']*\bviews-table\b""", re.I)
+_HREF_RE = re.compile(r"""<a\b[^>]*?\shref\s*=\s*["']([^"'>]+)["']""", re.I)
+_TABLE_CLOSE_RE = re.compile(r"</table\s*>", re.I)
+_TABLE_OPEN_RE = re.compile(r"<table\b", re.I)
+
+# Ergebnis-Container (Scope für Links), in Prioritätsreihenfolge
+_LINK_SCOPE_CLASSES = ("views-table", "view-content", "view")
+
+
+def _hrefs_in_views_table(html: str) -> List[str]:
+    """hrefs aus der ersten table.views-table (leer, wenn keine Tabelle gefunden).
+
+    Fast-Path nur für den einfachen Fall: fehlt das schließende Tag oder ist eine
+    weitere Tabelle verschachtelt, wird [] geliefert und _hrefs_in_scope übernimmt.
+    """
+    m = _VIEWS_TABLE_RE.search(html or "")
+    if not m:
+        return []
+    close = _TABLE_CLOSE_RE.search(html, m.end())
+    if not close:
+        return []
+    chunk = html[m.start():close.start()]
+    if _TABLE_OPEN_RE.search(chunk, m.end() - m.start()):
+        return []
+    return [unescape(h) if "&" in h else h for h in _HREF_RE.findall(chunk)]
+
+
+def _hrefs_in_scope(html: str) -> List[str]:
+    """
+    Fallback für ungewöhnliche Seiten: ein lxml-Streaming-Durchlauf ohne bs4-Baum.
+    Scope = erste table.views-table, sonst erstes .view-content, sonst erstes .view,
+    sonst alle <a href> der Seite.
+    """
+    if not html:
+        return []
+    scopes: Dict[str, object] = {}  # Klasse -> erstes passendes Element
+    scoped_hrefs: Dict[str, List[str]] = {c: [] for c in _LINK_SCOPE_CLASSES}
+    all_hrefs: List[str] = []
+
+    context = etree.iterparse(
+        io.BytesIO(html.encode("utf-8")), events=("start", "end"), html=True, encoding="utf-8"
+    )
+    for event, el in context:
+        if event == "start":
+            if el.tag == "a" or len(scopes) == len(_LINK_SCOPE_CLASSES):
+                continue
+            classes = (el.get("class") or "").split()
+            for c in _LINK_SCOPE_CLASSES:
+                if c in classes and c not in scopes and (c != "views-table" or el.tag == "table"):
+                    scopes[c] = el
+            continue
+
+        if el.tag != "a":
+            continue
+        href = el.get("href")
+        if href:
+            all_hrefs.append(href)
+            if scopes:
+                for anc in el.iterancestors():
+                    for c, scope_el in scopes.items():
+                        if anc is scope_el:
+                            scoped_hrefs[c].append(href)
+        el.clear()
+
+    for c in _LINK_SCOPE_CLASSES:
+        if c in scopes:
+            return scoped_hrefs[c]
+    return all_hrefs
+
+
 def extract_links_from_html(tab: TabDef, html: str) -> List[str]:
     if tab.key != "periodical":
         ids = extract_iipimage_ids_anywhere(html)
         if ids and tab.prefer_iipimage_only_if_present:
-            out = []
-            seen = set()
-            for pid in ids:
-                u = f"{BASE}/iipimage/{pid}"
-                if u not in seen:
-                    seen.add(u)
-                    out.append(u)
-            return out
-
-    out = []
-    seen = set()
+            # ids sind bereits eindeutig
+            return [f"{BASE}/iipimage/{pid}" for pid in ids]
+
+    # dict als geordnete Menge (Einfügereihenfolge = Trefferreihenfolge)
+    out: Dict[str, None] = {}
     try:
-        soup = BeautifulSoup(html or "", "html.parser")
-        scope = (
-            soup.select_one("table.views-table") or
-            soup.select_one(".view-content") or
-            soup.select_one(".view") or
-            soup
-        )
-        for a in scope.select("a[href]"):
-            u = normalize_pf_link(tab, a.get("href"))
-            if not u:
-                continue
-            if u in seen:
-                continue
-            seen.add(u)
-            out.append(u)
+        hrefs = _hrefs_in_views_table(html) or _hrefs_in_scope(html)
+        for href in hrefs:
+            u = normalize_pf_link(tab, href)
+            if u:
+                out[u] = None
     except Exception:
         pass
 
     if tab.key == "periodical":
         ids = extract_iipimage_ids_anywhere(html)
-        for pid in ids:
-            u = strip_language_param(f"{BASE}/iipimage/{pid}")
-            if u not in seen:
-                seen.add(u)
-                out.append(u)
+        out.update(dict.fromkeys(strip_language_param(f"{BASE}/iipimage/{pid}") for pid in ids))
 
-    return out
+    return list(out)
+
+
+_VIEW_EMPTY_RE = re.compile(r"""class\s*=\s*["'](?:[^"']*\s)?view-empty[\s"']""")
+
+
+def is_view_empty(html: str) -> bool:
+    """True, wenn Drupal die Ergebnisliste ausdrücklich leer gerendert hat (.view-empty)."""
+    return bool(html) and _VIEW_EMPTY_RE.search(html) is not None
 
 
 # ------------------------------------------------------------
@@ -711,7 +875,7 @@ def drupal_views_ajax_fetch(
     r.raise_for_status()
 
     try:
-        cmds = r.json()
+        cmds = _json_loads(r.content)
     except Exception:
         return r.text
 
@@ -726,77 +890,119 @@ def drupal_views_ajax_fetch(
     return "\n".join(html_parts)
 
 
-def build_visible_url(action_url: str, lang: str, exposed_items: List[Tuple[str, str]], page: int) -> str:
+def build_visible_url_prefix(action_url: str, lang: str, exposed_items: List[Tuple[str, str]]) -> str:
+    """Such-URL ohne Seitennummer (endet auf "page="); nur die Seite ändert sich pro Request."""
     items = list(exposed_items)
     if not any(k == "language" for k, _ in items):
         items.append(("language", lang))
-    items.append(("page", str(page)))
     qs = urlencode(items, doseq=True)
     sep = "&" if "?" in action_url else "?"
-    return action_url + sep + qs
+    return action_url + sep + qs + "&page="
 
 
 # ------------------------------------------------------------
 # Periodika: über /periodical/ Seiten alle Ausgaben holen
 # ------------------------------------------------------------
+def _make_request_throttle(delay_s: float, stop_event: threading.Event):
+    """Liefert wait_turn(): hält Request-Starts mindestens delay_s auseinander – auch über
+    parallele Threads hinweg (wie früher die Pause zwischen zwei sequentiellen Seiten).
+    wait_turn() gibt False zurück, wenn währenddessen Stop angefordert wurde."""
+    lock = threading.Lock()
+    next_slot = [0.0]
+
+    def wait_turn() -> bool:
+        if delay_s <= 0:
+            return not stop_event.is_set()
+        with lock:
+            now = time.monotonic()
+            slot = max(now, next_slot[0])
+            next_slot[0] = slot + delay_s
+        if slot > now:
+            return not stop_event.wait(slot - now)
+        return not stop_event.is_set()
+
+    return wait_turn
+
+
 def expand_periodicals_via_periodical_pages(
     session: requests.Session,
     links: List[str],
     delay_s: float,
     log_cb=None,
-    stop_flag=lambda: False,
+    stop_event: Optional[threading.Event] = None,
+    concurrency: int = CONCURRENCY,
 ) -> List[str]:
     periodical_pages = [u for u in links if "/periodical/" in u]
     if not periodical_pages:
         return links
+    stop_event = stop_event or threading.Event()
 
-    out_set = set(links)
-    out_list = list(links)
+    out: Dict[str, None] = dict.fromkeys(links)
 
     if log_cb:
         log_cb(f"[Periodika] Öffne {len(periodical_pages)} /periodical/-Seiten und lese alle Ausgaben …")
 
-    for idx, purl in enumerate(periodical_pages, start=1):
-        if stop_flag():
-            break
-        try:
-            html = fetch_html(session, purl, timeout=30)
-        except Exception as e:
-            if log_cb:
-                log_cb(f"  [Warn] /periodical/ Seite nicht ladbar ({idx}/{len(periodical_pages)}): {purl} -> {e}")
-            continue
+    wait_turn = _make_request_throttle(delay_s, stop_event)
 
-        ids = extract_iipimage_ids_anywhere(html)
-        new_cnt = 0
-        for pid in ids:
-            u = strip_language_param(f"{BASE}/iipimage/{pid}")
-            if u not in out_set:
-                out_set.add(u)
-                out_list.append(u)
-                new_cnt += 1
+    def fetch_ids(purl: str) -> Optional[List[str]]:
+        # läuft im Thread-Pool; delay_s = Mindestabstand zwischen zwei Request-Starts
+        if not wait_turn():
+            return None
+        body = fetch_bytes(session, purl, timeout=30)
+        return extract_iipimage_ids_anywhere(body)
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as ex:
+        futures = [ex.submit(fetch_ids, purl) for purl in periodical_pages]
 
-        if log_cb and (idx == 1 or idx % 10 == 0 or idx == len(periodical_pages)):
-            log_cb(f"  {idx}/{len(periodical_pages)}: +{new_cnt} Ausgaben (gesamt {len(out_list)})")
+        # Ergebnisse in Original-Reihenfolge einsammeln (stabile Ausgabe)
+        for idx, (purl, fut) in enumerate(zip(periodical_pages, futures), start=1):
+            if stop_event.is_set():
+                for f in futures:
+                    f.cancel()
+                break
+            try:
+                ids = fut.result()
+            except Exception as e:
+                if log_cb:
+                    log_cb(f"  [Warn] /periodical/ Seite nicht ladbar ({idx}/{len(periodical_pages)}): {purl} -> {e}")
+                continue
+            if ids is None:
+                continue
 
-        if delay_s > 0:
-            time.sleep(delay_s)
+            prev_len = len(out)
+            out.update(dict.fromkeys(strip_language_param(f"{BASE}/iipimage/{pid}") for pid in ids))
+            new_cnt = len(out) - prev_len
+
+            if log_cb and (idx == 1 or idx % 10 == 0 or idx == len(periodical_pages)):
+                log_cb(f"  {idx}/{len(periodical_pages)}: +{new_cnt} Ausgaben (gesamt {len(out)})")
 
     # am Ende nur Ausgaben (iipimage)
-    final = []
-    seen = set()
-    for u in out_list:
-        u = strip_language_param(u)
-        if "/iipimage/" not in u:
-            continue
-        if u not in seen:
-            seen.add(u)
-            final.append(u)
-    return final
+    stripped = (strip_language_param(u) for u in out)
+    return list(dict.fromkeys(u for u in stripped if "/iipimage/" in u))
 
 
 # ------------------------------------------------------------
 # Crawl
 # ------------------------------------------------------------
+# (path, lang) -> View-Info; nur vollständige Einträge (mit view_dom_id und view_display_id)
+_BOOT_VIEW_INFO: Dict[Tuple[str, str], dict] = {}
+
+
+def _boot_view_info(session: requests.Session, path: str, lang: str) -> dict:
+    """View-Info der Suchseite; gecacht, damit wiederholte Crawls desselben Tabs nicht neu laden.
+
+    Unvollständige Antworten (z.B. eine fehlerhaft gerenderte Seite) werden nicht gecacht,
+    der nächste Crawl versucht es dann erneut.
+    """
+    key = (path, lang)
+    info = _BOOT_VIEW_INFO.get(key)
+    if info is None:
+        info = parse_drupal_view_info(fetch_html(session, f"{BASE}{path}?language={lang}"))
+        if info.get("view_dom_id") and info.get("view_display_id"):
+            _BOOT_VIEW_INFO[key] = info
+    return info
+
+
 def crawl_tab_links(
     tab: TabDef,
     lang: str,
@@ -806,9 +1012,12 @@ def crawl_tab_links(
     max_pages: int,
     delay_s: float,
     log_cb=None,
-    stop_flag=lambda: False,
+    stop_event: Optional[threading.Event] = None,
+    concurrency: int = CONCURRENCY,
+    session: Optional[requests.Session] = None,
 ) -> List[str]:
-    session = make_session()
+    session = session or _SESSION
+    stop_event = stop_event or threading.Event()
 
     view_name = view_info.get("view_name") or "solr_searching"
     view_display_id = view_info.get("view_display_id") or ""
@@ -818,8 +1027,8 @@ def crawl_tab_links(
     view_path = tab.path.lstrip("/")
 
     if not view_dom_id or not view_display_id:
-        boot = fetch_html(session, f"{BASE}{tab.path}?language={lang}")
-        boot_info = parse_drupal_view_info(boot)
+        # nur wenn load_form_spec die IDs nicht liefern konnte
+        boot_info = _boot_view_info(session, tab.path, lang)
         view_dom_id = view_dom_id or boot_info.get("view_dom_id")
         view_display_id = view_display_id or boot_info.get("view_display_id") or ""
         view_name = view_name or boot_info.get("view_name") or "solr_searching"
@@ -834,30 +1043,47 @@ def crawl_tab_links(
     if log_cb:
         log_cb(f"[Debug] view_name={view_name} view_display_id={view_display_id} view_dom_id={view_dom_id}")
 
-    all_links: List[str] = []
-    seen = set()
-    empty_streak = 0
-    no_new_streak = 0
-
-    for page in range(max_pages):
-        if stop_flag():
-            break
-
-        visible_url = build_visible_url(action_url, lang, exposed_items, page)
-        if log_cb:
-            log_cb(f"[Suche] page={page} GET -> {visible_url}")
+    visible_url_prefix = build_visible_url_prefix(action_url, lang, exposed_items)
+
+    # Seiten ab end_page[0] werden nicht mehr geladen: gesetzt, sobald zwei leere Seiten
+    # in Folge bekannt sind (dort endet die Auswertung ohnehin) oder die Auswertung fertig ist
+    end_page = [max_pages]
+    empty_pages: set = set()
+    end_lock = threading.Lock()
+
+    def past_end(page: int) -> bool:
+        return page >= end_page[0] or stop_event.is_set()
+
+    def mark_empty(page: int):
+        with end_lock:
+            empty_pages.add(page)
+            if page - 1 in empty_pages:
+                end_page[0] = min(end_page[0], page + 1)
+            if page + 1 in empty_pages:
+                end_page[0] = min(end_page[0], page + 2)
+
+    def fetch_page(page: int) -> Tuple[List[str], List[str]]:
+        """Holt eine Ergebnisseite (GET, sonst /views/ajax). Läuft im Thread-Pool."""
+        notes: List[str] = []
+        if past_end(page):
+            return notes, []  # wird nicht mehr ausgewertet
+        visible_url = f"{visible_url_prefix}{page}"
+        notes.append(f"[Suche] page={page} GET -> {visible_url}")
 
         page_links: List[str] = []
+        confirmed_empty = False
         try:
             html = fetch_html(session, visible_url)
             page_links = extract_links_from_html(tab, html)
+            confirmed_empty = not page_links and is_view_empty(html)
         except Exception as e:
-            if log_cb:
-                log_cb(f"  [Warn] GET fehlgeschlagen: {e} (versuche AJAX)")
+            notes.append(f"  [Warn] GET fehlgeschlagen: {e} (versuche AJAX)")
 
-        if not page_links:
-            if log_cb:
-                log_cb("  [Info] Keine Treffer im GET – nutze /views/ajax …")
+        if confirmed_empty:
+            # Drupal hat die View gerendert und nichts gefunden – AJAX liefert dasselbe
+            notes.append("  [Info] Keine Treffer (view-empty) – kein /views/ajax nötig")
+        elif not page_links and not past_end(page):
+            notes.append("  [Info] Keine Treffer im GET – nutze /views/ajax …")
 
             frag = drupal_views_ajax_fetch(
                 session=session,
@@ -874,123 +1100,302 @@ def crawl_tab_links(
             page_links = extract_links_from_html(tab, frag)
 
         if not page_links:
-            empty_streak += 1
-            if log_cb:
-                log_cb(f"  (keine Treffer) streak={empty_streak}")
-            if empty_streak >= 2:
-                break
-            continue
-        empty_streak = 0
+            mark_empty(page)
+        return notes, page_links
 
-        new_cnt = 0
-        for u in page_links:
-            u = strip_language_param(u)
-            if u in seen:
-                continue
-            seen.add(u)
-            all_links.append(u)
-            new_cnt += 1
-
-        if log_cb:
-            log_cb(f"  Treffer: {len(page_links)} | neu: {new_cnt} | gesamt: {len(all_links)}")
-
-        if new_cnt == 0:
-            no_new_streak += 1
-            if log_cb:
-                log_cb(f"  (keine neuen Links) streak={no_new_streak}")
-            if no_new_streak >= 2:
-                break
-        else:
-            no_new_streak = 0
+    # geordnete Menge über den ganzen Crawl: Schlüssel = kanonische URL
+    all_links: Dict[str, None] = {}
+    empty_streak = 0
+    no_new_streak = 0
 
-        if delay_s > 0:
-            time.sleep(delay_s)
+    # höchstens `concurrency` Seiten gleichzeitig unterwegs; ausgewertet wird strikt in
+    # Seitenreihenfolge – die Streak-Abbrüche bleiben dadurch dieselben wie sequentiell.
+    # delay_s wird beim Einreichen eingehalten (Mindestabstand zwischen zwei Seitenabrufen),
+    # damit kein Worker-Thread schläft und Ende/Stop nicht auf Pausen warten müssen.
+    window = max(1, concurrency)
+    pending: deque = deque()
+    next_page = 0
+    next_slot = 0.0
+
+    def can_submit() -> bool:
+        # nach einer leeren Seite j (noch nicht ausgewertet) nur bis j+1 vorausladen –
+        # ist auch j+1 leer, ist die Liste zu Ende; sonst geht es danach normal weiter
+        frontier = pending[0][0] if pending else next_page
+        with end_lock:
+            hold = min((j + 2 for j in empty_pages if j + 1 >= frontier), default=max_pages)
+        return len(pending) < window and next_page < hold and not past_end(next_page)
+
+    with ThreadPoolExecutor(max_workers=window) as ex:
+        try:
+            while not stop_event.is_set():
+                if pending and pending[0][1].done():
+                    page, fut = pending.popleft()
+                    notes, page_links = fut.result()
+                    if log_cb:
+                        for m in notes:
+                            log_cb(m)
+
+                    finished = False
+                    if not page_links:
+                        empty_streak += 1
+                        if log_cb:
+                            log_cb(f"  (keine Treffer) streak={empty_streak}")
+                        finished = empty_streak >= 2
+                    else:
+                        empty_streak = 0
+
+                        prev_len = len(all_links)
+                        all_links.update(dict.fromkeys(map(strip_language_param, page_links)))
+                        new_cnt = len(all_links) - prev_len
+
+                        if log_cb:
+                            log_cb(f"  Treffer: {len(page_links)} | neu: {new_cnt} | gesamt: {len(all_links)}")
+
+                        if new_cnt == 0:
+                            no_new_streak += 1
+                            if log_cb:
+                                log_cb(f"  (keine neuen Links) streak={no_new_streak}")
+                            finished = no_new_streak >= 2
+                        else:
+                            no_new_streak = 0
+
+                    if finished:
+                        break
+                    continue
+
+                submit = can_submit()
+                now = time.monotonic()
+                if submit and now >= next_slot:
+                    pending.append((next_page, ex.submit(fetch_page, next_page)))
+                    next_page += 1
+                    next_slot = now + max(0.0, delay_s)
+                    continue
+                if not pending and not submit:
+                    break
+                timeout = next_slot - now if submit else None
+                if pending:
+                    futures_wait([pending[0][1]], timeout=timeout)
+                else:
+                    stop_event.wait(timeout)
+        finally:
+            # Ende, Stop oder Fehler: laufende Seiten überspringen ihre restlichen Requests
+            with end_lock:
+                end_page[0] = -1
+            for _, f in pending:
+                f.cancel()
 
     if tab.key == "periodical":
-        all_links = expand_periodicals_via_periodical_pages(
+        # liefert bereits kanonische, eindeutige /iipimage/-URLs
+        return expand_periodicals_via_periodical_pages(
             session=session,
-            links=all_links,
+            links=list(all_links),
             delay_s=delay_s,
             log_cb=log_cb,
-            stop_flag=stop_flag,
+            stop_event=stop_event,
+            concurrency=concurrency,
         )
 
-    final = []
-    final_seen = set()
-    for u in all_links:
-        u = strip_language_param(u)
-        if u not in final_seen:
-            final_seen.add(u)
-            final.append(u)
-
-    return final
+    return list(all_links)
 
 
 # ------------------------------------------------------------
 # Worker Thread (PySide6)
 # ------------------------------------------------------------
+@dataclass
+class CrawlJob:
+    tab: TabDef
+    lang: str
+    action_url: str
+    exposed_items: List[Tuple[str, str]]
+    view_info: dict
+    max_pages: int
+    delay_s: float
+    json_path: str
+    outdir: str
+    stop_event: threading.Event
+
+
 class CrawlWorker(QObject):
-    log = Signal(str)
-    done = Signal(list, str)
+    # langlebig: lebt in einem eigenen QThread und arbeitet Jobs über submit() ab
+    log = Signal(str)  # mehrere Zeilen, mit "\n" verbunden
+    done = Signal(int, str)  # (Anzahl Links, JSON-Pfad)
     failed = Signal(str)
 
-    def __init__(
-        self,
-        tab: TabDef,
-        lang: str,
-        action_url: str,
-        exposed_items: List[Tuple[str, str]],
-        view_info: dict,
-        max_pages: int,
-        delay_s: float,
-        json_path: str,
-        outdir: str,
-        stop_flag_callable,
-    ):
+    LOG_FLUSH_S = 0.1  # Log-Zeilen höchstens so lange puffern …
+    LOG_FLUSH_N = 32   # … oder bis so viele zusammengekommen sind
+
+    def __init__(self):
         super().__init__()
-        self.tab = tab
-        self.lang = lang
-        self.action_url = action_url
-        self.exposed_items = exposed_items
-        self.view_info = view_info
-        self.max_pages = max_pages
-        self.delay_s = delay_s
-        self.json_path = json_path
-        self.outdir = outdir
-        self.stop_flag_callable = stop_flag_callable
-
-    def run(self):
+        self._log_buf: deque = deque()
+        self._log_lock = threading.Lock()
+        self._log_pending = threading.Event()
+        # ein Flusher für die ganze Lebensdauer des Workers (nicht pro Job); ein QTimer im
+        # Worker-Thread ginge nicht, dessen Event-Loop ist während eines Jobs blockiert
+        threading.Thread(target=self._flush_log_loop, daemon=True).start()
+
+    def _queue_log(self, msg: str):
+        with self._log_lock:
+            self._log_buf.append(msg)
+            if len(self._log_buf) < self.LOG_FLUSH_N:
+                self._log_pending.set()
+                return
+        self._flush_log()
+
+    def _flush_log(self):
+        # ein Signal pro Batch statt pro Zeile (jede Emission weckt den GUI-Thread);
+        # Emission unter dem Lock, damit Batches in Reihenfolge ankommen
+        with self._log_lock:
+            if not self._log_buf:
+                return
+            batch = "\n".join(self._log_buf)
+            self._log_buf.clear()
+            self.log.emit(batch)
+
+    def _flush_log_loop(self):
+        # schläft, solange nichts gepuffert ist; sonst spätestens nach LOG_FLUSH_S ausgeben
+        while True:
+            self._log_pending.wait()
+            time.sleep(self.LOG_FLUSH_S)
+            self._log_pending.clear()
+            self._flush_log()
+
+    @Slot(object)
+    def submit(self, job: CrawlJob):
+        # Aufrufe kommen per Queued-Signal an und werden von der Event-Loop des
+        # Worker-Threads nacheinander abgearbeitet
         try:
             links = crawl_tab_links(
-                tab=self.tab,
-                lang=self.lang,
-                action_url=self.action_url,
-                exposed_items=self.exposed_items,
-                view_info=self.view_info,
-                max_pages=self.max_pages,
-                delay_s=self.delay_s,
-                log_cb=lambda m: self.log.emit(m),
-                stop_flag=self.stop_flag_callable,
+                tab=job.tab,
+                lang=job.lang,
+                action_url=job.action_url,
+                exposed_items=job.exposed_items,
+                view_info=job.view_info,
+                max_pages=job.max_pages,
+                delay_s=job.delay_s,
+                log_cb=self._queue_log,
+                stop_event=job.stop_event,
             )
 
-            items = [{"url": strip_language_param(u), "outdir": self.outdir, "pages": ""} for u in links]
-            os.makedirs(os.path.dirname(self.json_path), exist_ok=True)
-            with open(self.json_path, "w", encoding="utf-8") as f:
-                json.dump(items, f, ensure_ascii=False, indent=2)
-
-            self.done.emit(links, self.json_path)
+            # links sind bereits kanonisch (strip_language_param in crawl_tab_links)
+            items = [{"url": u, "outdir": job.outdir, "pages": ""} for u in links]
+            os.makedirs(os.path.dirname(job.json_path), exist_ok=True)
+            # erst in eine Temp-Datei daneben schreiben, dann atomar ersetzen –
+            # ein Abbruch mitten im Schreiben hinterlässt so keine halbe JSON
+            tmp = job.json_path + ".tmp"
+            try:
+                with open(tmp, "wb", buffering=1024 * 1024) as f:
+                    f.write(_json_dumps_bytes(items))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, job.json_path)
+            except BaseException:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+                raise
+
+            n = len(links)
+            del items, links  # Liste nicht über die Signal-Grenze mitschleppen
+
+            self._flush_log()
+            self.done.emit(n, job.json_path)
         except Exception as e:
+            self._flush_log()
             self.failed.emit(str(e))
 
 
 # ------------------------------------------------------------
 # MainWindow (PySide6 UI)
 # ------------------------------------------------------------
+_FROM_KEYS = frozenset({"from", "od_roku", "seit_jahr", "field_doc_dates_field_doc_dates_from"})
+_TO_KEYS = frozenset({"to", "do_roku", "bis_jahr", "field_doc_dates_field_doc_dates_to"})
+_TITLE_KEYS = frozenset({"title", "titel", "nadpis"})
+_ALL_LABELS = frozenset({"- Alle -", "- Vše -", "- Alles -", "All"})
+
+
+# Collector je Control-Art: (name, spec, exposed, state) -> hängt an exposed an, pflegt state
+def _collect_text(name: str, spec, exposed: List[Tuple[str, str]], state: dict):
+    ed: QLineEdit = spec[1]
+    val = (ed.text() or "").strip()
+    exposed.append((name, val))
+    if val:
+        if name in _FROM_KEYS:
+            state["year_from"] = val
+        if name in _TO_KEYS:
+            state["year_to"] = val
+
+
+def _collect_select(name: str, spec, exposed: List[Tuple[str, str]], state: dict):
+    cmb: QComboBox = spec[1]
+    lab = (cmb.currentText() or "").strip()
+    val = (cmb.currentData() or "")
+    exposed.append((name, str(val)))
+    if name.lower() in _TITLE_KEYS and lab and lab not in _ALL_LABELS:
+        state["title_label"] = lab
+
+
+def _collect_radio(name: str, spec, exposed: List[Tuple[str, str]], state: dict):
+    bg: QButtonGroup = spec[1]
+    b = bg.checkedButton()
+    exposed.append((name, str(b.property("pf_value") or "") if b is not None else ""))
+
+
+def _collect_checkbox(name: str, spec, exposed: List[Tuple[str, str]], state: dict):
+    cbs: List[QCheckBox] = spec[1]
+    for cb in cbs:
+        if cb.isChecked():
+            exposed.append((name, str(cb.property("pf_value") or "1")))
+
+
+_EXPOSED_COLLECTORS = {
+    "text": _collect_text,
+    "select": _collect_select,
+    "radio": _collect_radio,
+    "checkbox": _collect_checkbox,
+}
+
+
+def _make_exposed_collector(controls: dict):
+    # einmal pro aufgebautem Formular: Handler je Control vorab auflösen, damit
+    # beim Start weder Dict-Lookup noch Kind-Unterscheidung pro Widget anfällt.
+    # Crawler-Optionen (delay/maxpages) haben keinen Collector und fallen hier weg.
+    bound = []
+    for name, spec in controls.items():
+        collect = _EXPOSED_COLLECTORS.get(spec[0])
+        if collect is not None:
+            bound.append((collect, name, spec))
+
+    def collect_all(exposed: List[Tuple[str, str]], state: dict):
+        for collect, name, spec in bound:
+            collect(name, spec, exposed, state)
+
+    return collect_all
+
+
+_WS_RE = re.compile(r"\s+")
+_INVALID_FN_RE = re.compile(r'[\\/:*?"<>|]')
+
+
+def _sanitize_filename_part(x: str) -> str:
+    return _INVALID_FN_RE.sub("_", _WS_RE.sub(" ", (x or "").strip()))
+
+
 class MainWindow(QMainWindow):
+    # (Generation, tabkey, spec | None, Fehlertext) – aus den Lade-Threads in den GUI-Thread
+    form_loaded = Signal(int, str, object, str)
+    # CrawlJob -> CrawlWorker.submit (läuft im Worker-Thread)
+    work_request = Signal(object)
+
     def __init__(self):
         super().__init__()
         self.lang = "de"
-        self.session = make_session()
+        self.session = _SESSION
+
+        # Formulare aller Tabs parallel laden (HTTP in Daemon-Threads, Widgets im GUI-Thread);
+        # Daemon, damit ein hängender Request das Beenden der App nicht aufhält
+        self._form_gen = 0
+        self.form_loaded.connect(self._on_form_loaded, Qt.QueuedConnection)
 
         self.setWindowTitle(tr(self.lang, "app_title"))
         self.resize(1200, 820)
@@ -998,17 +1403,36 @@ class MainWindow(QMainWindow):
         self.forms: Dict[str, dict] = {}
         self.tab_ui: Dict[str, dict] = {}
 
-        self._stop = False
-        self._thread: Optional[QThread] = None
-        self._worker: Optional[CrawlWorker] = None
+        # ein Worker-Thread für die gesamte Laufzeit; Crawls werden als Jobs hineingereicht
+        self._stop_event = threading.Event()
+        self._crawl_running = False
+        self._close_pending = False  # Schließen angefordert, wartet auf Ende des Crawls
+        self._thread = QThread(self)
+        self._worker = CrawlWorker()
+        self._worker.moveToThread(self._thread)
+        self.work_request.connect(self._worker.submit, Qt.QueuedConnection)
+        self._worker.log.connect(self._on_worker_log, Qt.QueuedConnection)
+        self._worker.failed.connect(self._on_failed, Qt.QueuedConnection)
+        self._worker.done.connect(self._on_done, Qt.QueuedConnection)
+        self._thread.start()
 
         self._build_ui()
         self._load_all_forms()
 
     @Slot(str)
-    def _on_worker_log(self, msg: str):
-        tabkey = self._current_tab_key()
-        self._append_log(tr(self.lang, "log_prefix", tab=self._tab_title(tabkey)) + msg)
+    def _on_worker_log(self, batch: str):
+        prefix = tr(self.lang, "log_prefix", tab=self._tab_title(self._current_tab_key()))
+        text = prefix + batch.replace("\n", "\n" + prefix)
+        # ganzer Batch als Klartext in einem Schritt (append() würde HTML-artigen Text als
+        # Rich-Text deuten und Zeilen zusammenziehen); ein Edit-Block = ein Layout-Pass
+        cursor = QTextCursor(self.log.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        if not self.log.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertText(text)
+        cursor.endEditBlock()
+        self._schedule_log_scroll()
 
     def _build_ui(self):
         root = QWidget()
@@ -1072,6 +1496,11 @@ class MainWindow(QMainWindow):
         main.addWidget(self.log)
         self.log.document().setMaximumBlockCount(4000)  # begrenzt Logzeilen (RAM-Schutz)
 
+        self._log_scroll_timer = QTimer(self)
+        self._log_scroll_timer.setSingleShot(True)
+        self._log_scroll_timer.setInterval(200)
+        self._log_scroll_timer.timeout.connect(self._scroll_log_to_end)
+
     def _choose_folder(self):
         d = QFileDialog.getExistingDirectory(self, tr(self.lang, "choose_folder"))
         if d:
@@ -1097,11 +1526,16 @@ class MainWindow(QMainWindow):
 
     def _append_log(self, msg: str):
         self.log.append(msg)
-        # Auto-Scroll ans Ende
-        cursor = self.log.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        self.log.setTextCursor(cursor)
-        self.log.ensureCursorVisible()
+        self._schedule_log_scroll()
+
+    def _schedule_log_scroll(self):
+        # Auto-Scroll höchstens alle 200 ms statt Cursor-Arbeit (Layout-Pass) pro Zeile
+        if not self._log_scroll_timer.isActive():
+            self._log_scroll_timer.start()
+
+    def _scroll_log_to_end(self):
+        sb = self.log.verticalScrollBar()
+        sb.setValue(sb.maximum())
 
     def _build_tab(self, tab: TabDef, parent: QWidget):
         outer = QVBoxLayout(parent)
@@ -1142,41 +1576,85 @@ class MainWindow(QMainWindow):
             "content": content,
             "grid": grid,
             "controls": {},
+            "collect": _make_exposed_collector({}),
             "home_btn": btn_home,
         }
 
     def _load_all_forms(self):
         self.forms.clear()
+        # Ergebnisse älterer Ladevorgänge (z.B. vor einem Sprachwechsel) werden verworfen
+        self._form_gen += 1
         for tab in TABS:
-            self._load_form_for_tab(tab)
+            threading.Thread(
+                target=self._fetch_spec, args=(self._form_gen, tab, self.lang), daemon=True
+            ).start()
+
+    def _fetch_spec(self, gen: int, tab: TabDef, lang: str):
+        # läuft im Thread-Pool: nur Netzwerk/Parsing, keine Widgets anfassen
+        try:
+            spec, err = load_form_spec(self.session, tab, lang, timeout=FORM_TIMEOUT), ""
+        except Exception as e:
+            spec, err = None, str(e)
+        # veraltet oder Fenster bereits geschlossen (closeEvent erhöht die Generation)
+        if gen != self._form_gen:
+            return
+        try:
+            self.form_loaded.emit(gen, tab.key, spec, err)
+        except RuntimeError:
+            pass  # MainWindow wurde zwischen Prüfung und emit zerstört
+
+    @Slot(int, str, object, str)
+    def _on_form_loaded(self, gen: int, tabkey: str, spec: Optional[dict], err: str):
+        if gen != self._form_gen:
+            return
+        self._apply_spec(self.tab_ui[tabkey]["tab"], spec, err)
+
+    def closeEvent(self, event):
+        if self._crawl_running:
+            # laufenden Crawl abbrechen und erst schließen, wenn done/failed eintrifft –
+            # der Worker-Thread darf nicht mitten im Job zerstört werden
+            self._close_pending = True
+            self._stop_event.set()
+            self.lbl_status.setText(tr(self.lang, "stopping"))
+            event.ignore()
+            return
+        self._form_gen += 1  # noch laufende Formular-Ladevorgänge melden sich nicht mehr
+        # Worker ist untätig: quit() beendet die Event-Loop sofort
+        self._thread.quit()
+        self._thread.wait()
+        super().closeEvent(event)
 
     def _clear_layout(self, layout):
-        while layout.count():
-            item = layout.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.deleteLater()
-            elif item.layout() is not None:
-                self._clear_layout(item.layout())
-
-    def _load_form_for_tab(self, tab: TabDef):
+        # iterativ statt rekursiv; setParent(None) gibt Widgets sofort frei
+        # (deleteLater würde bis zum nächsten Event-Loop-Durchlauf warten)
+        stack = [layout]
+        while stack:
+            lay = stack.pop()
+            while lay.count():
+                item = lay.takeAt(0)
+                w = item.widget()
+                if w is not None:
+                    w.setParent(None)
+                elif item.layout() is not None:
+                    stack.append(item.layout())
+
+    def _apply_spec(self, tab: TabDef, spec: Optional[dict], err: str = ""):
         ui = self.tab_ui[tab.key]
         grid: QGridLayout = ui["grid"]
         self._clear_layout(grid)
         ui["controls"] = {}
+        ui["collect"] = _make_exposed_collector({})
 
         ui["home_btn"].setText(tr(self.lang, "home", tab=self._tab_title(tab.key)))
 
-        try:
-            spec = load_form_spec(self.session, tab, self.lang)
-            self.forms[tab.key] = spec
-        except Exception as e:
+        if spec is None:
             box = QGroupBox(tr(self.lang, "err_form"))
             v = QVBoxLayout(box)
             v.setContentsMargins(8, 8, 8, 8)
-            v.addWidget(QLabel(str(e)))
+            v.addWidget(QLabel(err))
             grid.addWidget(box, 0, 0, 1, 1)
             return
+        self.forms[tab.key] = spec
 
         widgets: List[WidgetSpec] = spec["widgets"]
 
@@ -1220,7 +1698,7 @@ class MainWindow(QMainWindow):
                 ui["controls"][ws.name] = ("select", cmb)
 
             elif ws.kind == "radio":
-                bg = QButtonGroup(self)
+                bg = QButtonGroup(g)  # lebt und stirbt mit der GroupBox
                 bg.setExclusive(True)
                 default_val = ws.default
                 opts = ws.options or []
@@ -1231,20 +1709,25 @@ class MainWindow(QMainWindow):
 
                 row_i = 0
                 col_i = 0
+                first_rb: Optional[QRadioButton] = None
+                any_checked = False
                 for lab, val in opts:
                     rb = QRadioButton(lab)
                     rb.setProperty("pf_value", val)
                     bg.addButton(rb)
                     gl.addWidget(rb, row_i, col_i, 1, 1)
+                    if first_rb is None:
+                        first_rb = rb
                     if default_val is not None and val == default_val:
                         rb.setChecked(True)
+                        any_checked = True
                     col_i += 1
                     if col_i >= ncols:
                         col_i = 0
                         row_i += 1
 
-                if not any(b.isChecked() for b in bg.buttons()) and bg.buttons():
-                    bg.buttons()[0].setChecked(True)
+                if not any_checked and first_rb is not None:
+                    first_rb.setChecked(True)
 
                 ui["controls"][ws.name] = ("radio", bg)
 
@@ -1289,6 +1772,7 @@ class MainWindow(QMainWindow):
         hb.addWidget(QLabel(tr(self.lang, "delay")))
         ed_delay = QLineEdit("0.25")
         ed_delay.setMaximumWidth(120)
+        ed_delay.setToolTip(tr(self.lang, "delay_tip", n=CONCURRENCY))
         hb.addWidget(ed_delay)
 
         hb.addWidget(QLabel(tr(self.lang, "max_pages")))
@@ -1300,6 +1784,7 @@ class MainWindow(QMainWindow):
 
         ui["controls"]["__delay__"] = ("delay", ed_delay)
         ui["controls"]["__maxpages__"] = ("maxpages", ed_max)
+        ui["collect"] = _make_exposed_collector(ui["controls"])
 
         grid.addWidget(crawler_box, r + 1, 0, 1, col_count, Qt.AlignTop)
 
@@ -1311,65 +1796,15 @@ class MainWindow(QMainWindow):
         return TABS[idx].key
 
     def _collect_exposed_items(self, tabkey: str) -> Tuple[List[Tuple[str, str]], str, str, str]:
-        ui = self.tab_ui[tabkey]
-        controls = ui["controls"]
-
         exposed: List[Tuple[str, str]] = [("language", self.lang)]
-        title_label = self._tab_title(tabkey)
-        year_from = ""
-        year_to = ""
-
-        from_keys = {"from", "od_roku", "seit_jahr", "field_doc_dates_field_doc_dates_from"}
-        to_keys = {"to", "do_roku", "bis_jahr", "field_doc_dates_field_doc_dates_to"}
-
-        for name, spec in controls.items():
-            if name in ("__delay__", "__maxpages__"):
-                continue
-
-            kind = spec[0]
-
-            if kind == "text":
-                ed: QLineEdit = spec[1]
-                val = (ed.text() or "").strip()
-                exposed.append((name, val))
-                if name in from_keys and val:
-                    year_from = val
-                if name in to_keys and val:
-                    year_to = val
-
-            elif kind == "select":
-                cmb: QComboBox = spec[1]
-                lab = (cmb.currentText() or "").strip()
-                val = (cmb.currentData() or "")
-                exposed.append((name, str(val)))
-                if name.lower() in ("title", "titel", "nadpis"):
-                    if lab and lab not in ("- Alle -", "- Vše -", "- Alles -", "- Alle -", "All"):
-                        title_label = lab
-
-            elif kind == "radio":
-                bg: QButtonGroup = spec[1]
-                chosen = ""
-                for b in bg.buttons():
-                    if b.isChecked():
-                        chosen = str(b.property("pf_value") or "")
-                        break
-                exposed.append((name, chosen))
-
-            elif kind == "checkbox":
-                cbs: List[QCheckBox] = spec[1]
-                for cb in cbs:
-                    if cb.isChecked():
-                        exposed.append((name, str(cb.property("pf_value") or "1")))
+        state = {"title_label": self._tab_title(tabkey), "year_from": "", "year_to": ""}
+        self.tab_ui[tabkey]["collect"](exposed, state)
 
+        title_label, year_from, year_to = state["title_label"], state["year_from"], state["year_to"]
         return exposed, title_label, year_from, year_to
 
     def _build_json_path(self, folder: str, title_label: str, year_from: str, year_to: str) -> str:
-        def sanitize(x: str) -> str:
-            x = (x or "").strip()
-            x = re.sub(r"\s+", " ", x)
-            x = re.sub(r'[\\/:*?"<>|]', "_", x)
-            return x
-
+        sanitize = _sanitize_filename_part
         title_label = sanitize(title_label) or "Linkliste"
         if year_from and year_to:
             span = f"{sanitize(year_from)}-{sanitize(year_to)}"
@@ -1391,13 +1826,15 @@ class MainWindow(QMainWindow):
             return
 
         tabkey = self._current_tab_key()
-        tabdef = next(t for t in TABS if t.key == tabkey)
+        tabdef = TABS_BY_KEY[tabkey]
         spec = self.forms.get(tabkey)
         if not spec:
             QMessageBox.critical(self, tr(self.lang, "app_title"), tr(self.lang, "err_form"))
             return
 
-        self._stop = False
+        # frisches Event pro Job: ein noch auslaufender alter Job bleibt gestoppt
+        self._stop_event = threading.Event()
+        self._crawl_running = True
         self.btn_start.setEnabled(False)
         self.btn_stop.setEnabled(True)
         self.lbl_status.setText(tr(self.lang, "running"))
@@ -1419,8 +1856,7 @@ class MainWindow(QMainWindow):
         self._append_log(tr(self.lang, "log_prefix", tab=self._tab_title(tabkey)) + f"[Info] JSON: {json_path}")
         self._append_log(tr(self.lang, "log_prefix", tab=self._tab_title(tabkey)) + f"[Info] Exposed: {exposed_items}")
 
-        self._thread = QThread()
-        self._worker = CrawlWorker(
+        self.work_request.emit(CrawlJob(
             tab=tabdef,
             lang=self.lang,
             action_url=spec["action"],
@@ -1430,44 +1866,35 @@ class MainWindow(QMainWindow):
             delay_s=delay_s,
             json_path=json_path,
             outdir=folder,
-            stop_flag_callable=lambda: self._stop,
-        )
-        self._worker.moveToThread(self._thread)
-
-        self._thread.started.connect(self._worker.run)
-        self._worker.log.connect(self._on_worker_log, Qt.QueuedConnection)
-        self._worker.failed.connect(self._on_failed)
-        self._worker.done.connect(self._on_done)
-
-        self._thread.start()
+            stop_event=self._stop_event,
+        ))
 
     def _stop_crawl(self):
-        self._stop = True
+        self._stop_event.set()
         self.lbl_status.setText(tr(self.lang, "stopping"))
         self._append_log(tr(self.lang, "log_prefix", tab=self._tab_title(self._current_tab_key())) + tr(self.lang, "stopping"))
 
-    def _cleanup_thread(self):
-        if self._thread:
-            self._thread.quit()
-            self._thread.wait(1500)
-        self._thread = None
-        self._worker = None
-
     def _on_failed(self, msg: str):
+        self._crawl_running = False
         self._append_log(tr(self.lang, "err", msg=msg))
+        if self._close_pending:
+            self.close()
+            return
         QMessageBox.critical(self, tr(self.lang, "app_title"), tr(self.lang, "err", msg=msg))
         self.lbl_status.setText(tr(self.lang, "ready"))
         self.btn_start.setEnabled(True)
         self.btn_stop.setEnabled(False)
-        self._cleanup_thread()
 
-    def _on_done(self, links: list, path: str):
-        self._append_log(tr(self.lang, "saved", n=len(links), path=path))
-        QMessageBox.information(self, tr(self.lang, "app_title"), tr(self.lang, "saved", n=len(links), path=path))
+    def _on_done(self, n: int, path: str):
+        self._crawl_running = False
+        self._append_log(tr(self.lang, "saved", n=n, path=path))
+        if self._close_pending:
+            self.close()
+            return
+        QMessageBox.information(self, tr(self.lang, "app_title"), tr(self.lang, "saved", n=n, path=path))
         self.lbl_status.setText(tr(self.lang, "ready"))
         self.btn_start.setEnabled(True)
         self.btn_stop.setEnabled(False)
-        self._cleanup_thread()
 
 
 def main():